@@ -0,0 +1,75 @@
+import re
+import subprocess
+import sys
+import typer
+from typing_extensions import Annotated
+
+ENTRYPOINT = "locomote.cli"
+# Only needed for clip/gif/webm exports, diff inputs and token speed
+LAZY_MODULES = ["moviepy", "numpy", "imageio", "git", "tiktoken"]
+# Best of 20 runs measured 148-178ms on Python 3.11, plus ~40% headroom
+TARGET_MS = 250.0
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+app = typer.Typer()
+
+
+def importtime(module: str) -> list[tuple[int, int, bool, str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = []
+    for line in proc.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append((int(self_us), int(cumulative_us), len(indent) == 1, name))
+    return imports
+
+
+@app.command()
+def run(
+    runs: Annotated[
+        int, typer.Option(min=1, help="Number of interpreter launches")
+    ] = 5,
+    target_ms: Annotated[
+        float, typer.Option(help="Fail when the best run is slower than this")
+    ] = TARGET_MS,
+    top: Annotated[int, typer.Option(help="Number of heaviest modules to list")] = 10,
+):
+    package = ENTRYPOINT.split(".")[0]
+    results = []
+    for _ in range(runs):
+        imports = importtime(ENTRYPOINT)
+        elapsed_ms = (
+            sum(
+                cumulative
+                for _, cumulative, toplevel, name in imports
+                if toplevel and name.split(".")[0] == package
+            )
+            / 1000
+        )
+        results.append((elapsed_ms, imports))
+    best_ms, imports = min(results, key=lambda result: result[0])
+    worst_ms = max(elapsed_ms for elapsed_ms, _ in results)
+    print(f"{ENTRYPOINT}: best {best_ms:.1f}ms, worst {worst_ms:.1f}ms over {runs} runs")
+
+    print(f"Heaviest {top} modules in the best run (self time):")
+    for self_us, _, _, name in sorted(imports, reverse=True)[:top]:
+        print(f"  {self_us / 1000:8.1f}ms  {name}")
+
+    loaded = {name.split(".")[0] for _, _, _, name in imports}
+    eager = [module for module in LAZY_MODULES if module in loaded]
+    if eager:
+        print(f"Imported at startup but should be lazy: {', '.join(eager)}")
+    if best_ms > target_ms:
+        print(f"Startup {best_ms:.1f}ms exceeds target {target_ms:.1f}ms")
+    if eager or best_ms > target_ms:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -1,13 +1,11 @@
 import asyncio
 import typer
 import toml
-from numpy import array as np_array
-from moviepy.editor import ImageSequenceClip, CompositeVideoClip
 from dacite import from_dict
 from pathlib import Path
 from pygments.lexers import get_lexer_by_name
 from locomote.config import Cfg, DiffCfg, DiffRangeCfg, CmdCfg, RawCfg, FileCfg, ComposedCfg, LogFileCfg
-from locomote.sequence import Sequence
+from locomote.sequence import Sequence, Viewport
 from locomote.frame import window_img, window_ctl_img, code_img, still, CodeDisplay
 from PIL import Image as PILImage
 from PIL.Image import Image
@@ -18,7 +16,13 @@ app = typer.Typer()
 
 async def cfg_sequences(cfg: Cfg) -> list[tuple[CodeDisplay, Sequence]]:
     if isinstance(cfg.input, RawCfg):
-        seq = Sequence(cfg.input.seq_start, cfg.input.seq_end, cfg.output.speed)
+        seq = Sequence(
+            cfg.input.seq_start,
+            cfg.input.seq_end,
+            cfg.output.speed,
+            viewport_lines=cfg.viewport_lines,
+            scroll_frames=cfg.scroll_frames,
+        )
         display = CodeDisplay(
             font_manager=cfg.font_manager,
             token_styles=cfg.token_styles,
@@ -35,7 +39,13 @@ async def cfg_sequences(cfg: Cfg) -> list[tuple[CodeDisplay, Sequence]]:
                 seq_start = f.read()
         else:
             seq_start = ""
-        seq = Sequence(seq_start, seq_end, cfg.output.speed)
+        seq = Sequence(
+            seq_start,
+            seq_end,
+            cfg.output.speed,
+            viewport_lines=cfg.viewport_lines,
+            scroll_frames=cfg.scroll_frames,
+        )
         display = CodeDisplay(
             font_manager=cfg.font_manager,
             token_styles=cfg.token_styles,
@@ -80,7 +90,13 @@ async def cfg_sequences(cfg: Cfg) -> list[tuple[CodeDisplay, Sequence]]:
         )
         return [(out_display, seq_log)]
     elif isinstance(cfg.input, DiffCfg):
-        seq = Sequence(cfg.input.seq_start, cfg.input.seq_end, cfg.output.speed)
+        seq = Sequence(
+            cfg.input.seq_start,
+            cfg.input.seq_end,
+            cfg.output.speed,
+            viewport_lines=cfg.viewport_lines,
+            scroll_frames=cfg.scroll_frames,
+        )
         display = CodeDisplay(
             font_manager=cfg.font_manager,
             token_styles=cfg.token_styles,
@@ -98,7 +114,7 @@ async def cfg_sequences(cfg: Cfg) -> list[tuple[CodeDisplay, Sequence]]:
 
 async def content_blocks(
     sequences: list[tuple[CodeDisplay, Sequence]],
-) -> list[list[tuple[CodeDisplay, str]]]:
+) -> list[list[tuple[CodeDisplay, str | Viewport]]]:
     blocks = []
     stored = []
     for display, sequence in sequences:
@@ -175,6 +191,10 @@ async def exec_cfg(cfg: Cfg):
     outpath = Path(cfg.output.path)
     if not outpath.exists():
         outpath.mkdir(parents=True)
+    if {"clip", "gif", "webm"} & set(cfg.output.exports):
+        # moviepy pulls in numpy, imageio and ffmpeg discovery, stills don't need it
+        from numpy import array as np_array
+        from moviepy.editor import ImageSequenceClip, CompositeVideoClip
     clip = None
     if "clip" in cfg.output.exports:
         bg_image = PILImage.new("RGBA", (last_frame.width, last_frame.height), "#71dd7c")
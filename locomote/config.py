@@ -1,12 +1,14 @@
 from dataclasses import dataclass
-from git import Repo, Commit
-from typing import Literal
+from typing import Literal, TYPE_CHECKING
 from pygments.lexers import get_lexer_by_name
 from pygments.styles import get_style_by_name
 from functools import cached_property
 from PIL import ImageFont
 from pygments.formatters.img import FontManager
 
+if TYPE_CHECKING:
+    from git import Repo, Commit
+
 
 @dataclass
 class OutputCfg:
@@ -27,6 +29,8 @@ class OutputCfg:
     style: str = "monokai"
     line_wrap: int | None = None
     max_line_display: int | None = None
+    viewport_lines: int | None = None
+    scroll_frames: int = 5
     padding_horizontal: int = 70
     padding_vertical: int = 40
 
@@ -41,6 +45,14 @@ class OutputCfg:
     fps: int = 10
     speed: Literal["line", "token"] = "token"
 
+    def __post_init__(self):
+        if self.viewport_lines is not None and self.viewport_lines < 1:
+            raise ValueError(f"viewport_lines must be at least 1, got {self.viewport_lines}")
+        if self.scroll_frames < 0:
+            raise ValueError(f"scroll_frames must not be negative, got {self.scroll_frames}")
+        if self.viewport_lines and self.max_line_display:
+            raise ValueError("viewport_lines and max_line_display cannot be combined")
+
 
 @dataclass
 class RawCfg:
@@ -65,15 +77,17 @@ class DiffCfg:
     repo_path: str | None = None
 
     @cached_property
-    def repo(self) -> Repo:
+    def repo(self) -> "Repo":
+        from git import Repo
+
         return Repo(self.repo_path) if self.repo_path else Repo(".")
 
     @cached_property
-    def commit_start(self) -> Commit:
+    def commit_start(self) -> "Commit":
         return self.repo.commit(self.rev_start)
 
     @cached_property
-    def commit_end(self) -> Commit:
+    def commit_end(self) -> "Commit":
         return self.repo.commit(self.rev_end)
 
     @property
@@ -84,7 +98,7 @@ class DiffCfg:
     def seq_end(self) -> str:
         return self.content_for(self.commit_end)
 
-    def content_for(self, commit: Commit) -> str:
+    def content_for(self, commit: "Commit") -> str:
         try:
             return commit.tree[str(self.file)].data_stream.read().decode()
         except KeyError:
@@ -99,7 +113,9 @@ class DiffRangeCfg:
     repo_path: str | None = None
 
     @property
-    def commits(self) -> list[Commit]:
+    def commits(self) -> list["Commit"]:
+        from git import Repo
+
         repo = Repo(self.repo_path) if self.repo_path else Repo(".")
         return sorted(
             [x for x in repo.iter_commits(rev=self.rev_range, paths=self.file)],
@@ -146,7 +162,8 @@ class Cfg:
 
     @cached_property
     def lexer(self):
-        return get_lexer_by_name(self.input.lang)
+        # Keep leading blank lines so rendered rows match the sequence's lines
+        return get_lexer_by_name(self.input.lang, stripnl=False)
 
     @cached_property
     def style(self):
@@ -178,6 +195,14 @@ class Cfg:
     def max_line_display(self) -> int | None:
         return self.output.max_line_display
 
+    @cached_property
+    def viewport_lines(self) -> int | None:
+        return self.output.viewport_lines
+
+    @cached_property
+    def scroll_frames(self) -> int:
+        return self.output.scroll_frames
+
     @cached_property
     def max_line_chars(self) -> int | None:
         return self.output.line_wrap
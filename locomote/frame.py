@@ -1,12 +1,14 @@
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from PIL import Image
 from PIL.Image import Image as ImageT
 from PIL.ImageFont import ImageFont
 from PIL.ImageDraw import ImageDraw
 from pygments.lexer import Lexer
 from pygments.style import Style
+from pygments.token import _TokenType
 from pygments.formatters.img import FontManager
+from locomote.sequence import Viewport
 
 logger = logging.getLogger("pil")
 
@@ -64,52 +66,75 @@ class CodeDisplay:
     font_manager: FontManager
     token_styles: dict
     line_height: int
+    lexed: tuple[str, list[list[tuple[_TokenType, str]]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def lexed_lines(self, code: str) -> list[list[tuple[_TokenType, str]]]:
+        # Lex from the start of `code` so multi-line constructs above a
+        # viewport keep their highlighting. Each distinct state is lexed once
+        # and reused by its scroll frames, but lexing a state is still
+        # proportional to its full length, only drawing is bounded.
+        if self.lexed is None or self.lexed[0] != code:
+            lines = [[]]
+            for token, token_content in self.lexer.get_tokens(code):
+                for part in token_content.splitlines(keepends=True):
+                    text = part.splitlines()[0]
+                    if text:
+                        lines[-1].append((token, text))
+                    if text != part:
+                        lines.append([])
+            self.lexed = (code, lines)
+        return self.lexed[1]
 
     async def __call__(
         self,
         draw: ImageDraw,
         code: str,
+        top: int = 0,
+        rows: int | None = None,
     ) -> None:
-        lineno = 0
-        drawn = ""
-        for token, token_content in self.lexer.get_tokens(code):
-            if token_content == "\n":
-                lineno += 1
-                drawn = ""
-                continue
-            while token not in self.token_styles:
-                token = token.parent
-            style = self.token_styles[token]
-            color = f"#{style.get('color', 'fff')}"
-            font = self.font_manager.get_font(style["bold"], style["italic"])
-            draw.text(
-                (font.getbbox(drawn)[2], lineno * self.line_height),
-                token_content,
-                font=font,
-                fill=color,
-            )
-            drawn += token_content
-            if token_content.endswith("\n"):
-                lineno += 1
-                drawn = ""
+        lines = self.lexed_lines(code)
+        bottom = top + rows if rows is not None else len(lines)
+        for lineno, line in enumerate(lines[top:bottom]):
+            drawn = ""
+            for token, text in line:
+                while token not in self.token_styles:
+                    token = token.parent
+                style = self.token_styles[token]
+                color = f"#{style.get('color', 'fff')}"
+                font = self.font_manager.get_font(style["bold"], style["italic"])
+                draw.text(
+                    (font.getbbox(drawn)[2], lineno * self.line_height),
+                    text,
+                    font=font,
+                    fill=color,
+                )
+                drawn += text
 
 
 async def code_img(
-    blocks: list[tuple[CodeDisplay, str]],
+    blocks: list[tuple[CodeDisplay, str | Viewport]],
     width: int,
     height: int,
 ) -> ImageT:
     image = Image.new("RGBA", (width, height), (0, 0, 0, 0))
     offset_y = 0
     for display, code in blocks:
-        code_h = len(code.splitlines()) * display.line_height
+        if isinstance(code, Viewport):
+            code_h = code.rows * display.line_height
+        else:
+            code_h = len(code.splitlines()) * display.line_height
         code_img = Image.new(
             "RGBA",
             (width, code_h),
             (0, 0, 0, 0),
         )
         draw = ImageDraw(code_img)
-        await display(draw, code)
+        if isinstance(code, Viewport):
+            await display(draw, code.code, top=code.top, rows=code.rows)
+        else:
+            await display(draw, code)
         image.paste(code_img, (0, offset_y))
 
         offset_y += code_img.height
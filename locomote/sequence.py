@@ -1,15 +1,23 @@
 from dataclasses import dataclass
 from difflib import ndiff
-from tiktoken import encoding_for_model
+from functools import cache
 from typing import Literal
 
-GptEnc = encoding_for_model("gpt-4o")
 Speed = Literal["token", "newline"]
 
 
+@cache
+def gpt_enc():
+    # tiktoken is slow to import and build, only load it for token speed
+    from tiktoken import encoding_for_model
+
+    return encoding_for_model("gpt-4o")
+
+
 def get_tokens(seq: str) -> list[str]:
-    tokens = GptEnc.encode(seq)
-    return [GptEnc.decode_single_token_bytes(x).decode() for x in tokens]
+    enc = gpt_enc()
+    tokens = enc.encode(seq)
+    return [enc.decode_single_token_bytes(x).decode() for x in tokens]
 
 
 @dataclass
@@ -70,6 +78,17 @@ class Diff:
         return resolved
 
 
+@dataclass
+class Viewport:
+    code: str
+    top: int
+    rows: int
+
+    @property
+    def lines(self) -> list[str]:
+        return self.code.splitlines()[self.top : self.top + self.rows]
+
+
 @dataclass
 class Sequence:
     start: str
@@ -77,6 +96,8 @@ class Sequence:
     speed: Speed = "token"
     max_line_display: int | None = None
     max_line_chars: int | None = None
+    viewport_lines: int | None = None
+    scroll_frames: int = 5
 
     @property
     def line_diffs(self) -> list[Diff]:
@@ -96,6 +117,13 @@ class Sequence:
             diffs += token_diffs
         return Diff.resolve(diffs)
 
+    @property
+    def diffs(self) -> list[Diff]:
+        if self.speed == "line":
+            return self.line_diffs
+        elif self.speed == "token":
+            return self.token_diffs
+
     def width(self, char_width: int) -> int:
         if self.max_line_chars:
             return self.max_line_chars * char_width
@@ -104,6 +132,9 @@ class Sequence:
         return longest_line_length * char_width
 
     def height(self, char_height: int) -> int:
+        if self.viewport_lines:
+            total_lines = max(len(self.start.splitlines()), len(self.end.splitlines()))
+            return min(self.viewport_lines, total_lines) * char_height
         if self.max_line_display:
             return self.max_line_display * char_height
         start_height = len(self.start.splitlines()) * char_height
@@ -117,14 +148,51 @@ class Sequence:
             seq = "\n".join(line[: self.max_line_chars] for line in seq.splitlines())
         return seq
 
+    def viewports(self, seq: str, tops: list[int]) -> list[Viewport]:
+        # Keep the full state so the lexer sees context above the viewport,
+        # all frames of one state share the same text so it is lexed once
+        if self.max_line_chars:
+            seq = "\n".join(line[: self.max_line_chars] for line in seq.splitlines())
+        total_lines = len(seq.splitlines())
+        return [
+            Viewport(seq, top, min(self.viewport_lines, max(0, total_lines - top)))
+            for top in tops
+        ]
+
+    def viewport_top(self, seq: str, cursor: int, top: int) -> int:
+        # Keep the viewport still while the cursor is visible, else center it
+        last_top = max(0, len(seq.splitlines()) - self.viewport_lines)
+        line = seq.count("\n", 0, cursor)
+        if not top <= line < top + self.viewport_lines:
+            top = line - self.viewport_lines // 2
+        return min(max(0, top), last_top)
+
+    def scroll(self, top: int, target: int) -> list[int]:
+        distance = target - top
+        steps = min(abs(distance), self.scroll_frames)
+        return [top + round(distance * (i + 1) / steps) for i in range(steps)]
+
+    def scrolled(self):
+        seq = self.start
+        top = 0
+        frames = [top]
+        for diff in self.diffs:
+            target = self.viewport_top(seq, diff.cursor, top)
+            yield from self.viewports(seq, frames + self.scroll(top, target))
+            seq = diff(seq)
+            top = self.viewport_top(seq, diff.cursor, target)
+            frames = [top]
+        yield from self.viewports(seq, frames)
+        last_top = max(0, len(self.end.splitlines()) - self.viewport_lines)
+        yield from self.viewports(self.end, [min(top, last_top)])
+
     def __iter__(self):
+        if self.viewport_lines:
+            yield from self.scrolled()
+            return
         seq = self.start
         yield self.display(seq)
-        if self.speed == "line":
-            diffs = self.line_diffs
-        elif self.speed == "token":
-            diffs = self.token_diffs
-        for diff in diffs:
+        for diff in self.diffs:
             seq = diff(seq)
             yield self.display(seq)
         yield self.display(self.end)
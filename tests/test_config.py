@@ -0,0 +1,18 @@
+import pytest
+from locomote.config import OutputCfg
+
+
+@pytest.mark.parametrize("viewport_lines", [0, -1])
+def test_viewport_lines_must_be_positive(viewport_lines):
+    with pytest.raises(ValueError):
+        OutputCfg(path=".", exports=["still"], viewport_lines=viewport_lines)
+
+
+def test_scroll_frames_must_not_be_negative():
+    with pytest.raises(ValueError):
+        OutputCfg(path=".", exports=["still"], viewport_lines=5, scroll_frames=-1)
+
+
+def test_viewport_excludes_max_line_display():
+    with pytest.raises(ValueError):
+        OutputCfg(path=".", exports=["still"], viewport_lines=5, max_line_display=5)
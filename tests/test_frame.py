@@ -0,0 +1,91 @@
+import asyncio
+from PIL import ImageFont
+from pygments.lexers import get_lexer_by_name
+from pygments.styles import get_style_by_name
+from locomote.config import Cfg, OutputCfg, RawCfg
+from locomote.frame import CodeDisplay
+from locomote.sequence import Sequence
+
+CODE = '''def f():
+    """
+    return 1
+    """
+    return 2
+'''
+
+
+class FontManager:
+    def get_font(self, bold, italic):
+        return ImageFont.load_default()
+
+
+class Draw:
+    def __init__(self):
+        self.texts = []
+
+    def text(self, xy, text, font, fill):
+        self.texts.append((xy[1], text, fill))
+
+
+def code_display(lexer=None) -> CodeDisplay:
+    style = get_style_by_name("monokai")
+    return CodeDisplay(
+        lexer=lexer or get_lexer_by_name("python"),
+        style=style,
+        font_manager=FontManager(),
+        token_styles=dict(style),
+        line_height=10,
+    )
+
+
+def render(code: str = CODE, display=None, **kwargs) -> list[tuple[int, str, str]]:
+    draw = Draw()
+    asyncio.run((display or code_display())(draw, code, **kwargs))
+    return draw.texts
+
+
+def drawn_lines(texts: list[tuple[int, str, str]]) -> list[str]:
+    lines = {}
+    for y, text, _ in texts:
+        lines[y] = lines.get(y, "") + text
+    return [lines[y] for y in sorted(lines)]
+
+
+def test_viewport_keeps_lexer_context():
+    full = render()
+    viewport = render(top=2, rows=2)
+    assert {y for y, _, _ in viewport} == {0, 10}
+    assert viewport == [(y - 20, text, fill) for y, text, fill in full if 20 <= y < 40]
+    assert "return 1" in "".join(text for _, text, _ in viewport)
+
+
+def test_viewport_with_leading_blank_lines():
+    cfg = Cfg(
+        input=RawCfg(seq_start="", seq_end="", lang="python"),
+        output=OutputCfg(path=".", exports=["still"]),
+    )
+    code = "\n\n" + "".join(f"x{i} = {i}\n" for i in range(20))
+    seq = Sequence("", code, "line", viewport_lines=3)
+    [view] = seq.viewports(code, [14])
+    texts = render(view.code, code_display(cfg.lexer), top=view.top, rows=view.rows)
+    assert drawn_lines(texts) == view.lines == ["x12 = 12", "x13 = 13", "x14 = 14"]
+
+
+def test_lexes_each_state_once():
+    class CountingLexer:
+        def __init__(self):
+            self.lexer = get_lexer_by_name("python")
+            self.calls = 0
+
+        def get_tokens(self, code):
+            self.calls += 1
+            return self.lexer.get_tokens(code)
+
+    lexer = CountingLexer()
+    display = code_display(lexer)
+    start = "".join(f"x{i} = {i}\n" for i in range(40))
+    seq = Sequence(start, start + "y = 1\n", "line", viewport_lines=10)
+    for view in seq:
+        render(view.code, display, top=view.top, rows=view.rows)
+    # the start state with its scroll frames, then the appended state
+    assert lexer.calls == 2
@@ -0,0 +1,61 @@
+from locomote.sequence import Sequence
+
+
+def numbered(n: int) -> str:
+    return "".join(f"line {i}\n" for i in range(n))
+
+
+def tops(seq: Sequence) -> list[int]:
+    return [view.top for view in seq]
+
+
+def test_viewport_scrolls_to_cursor():
+    start = numbered(40)
+    end = start.replace("line 1\n", "line 1 changed\n").replace(
+        "line 34\n", "line 34 changed\n"
+    )
+    seq = Sequence(start, end, "line", viewport_lines=10, scroll_frames=3)
+    frames = list(seq)
+    assert all(len(view.lines) <= 10 for view in frames)
+    # start, edit line 1, scroll, edit line 34, end
+    assert tops(seq) == [0, 0, 10, 19, 29, 29, 29]
+    assert frames[-1].lines[5] == "line 34 changed"
+
+
+def test_viewport_clamps_to_last_line():
+    start = numbered(40)
+    end = start.replace("line 39\n", "line 39 changed\n")
+    seq = Sequence(start, end, "line", viewport_lines=10, scroll_frames=2)
+    assert tops(seq) == [0, 15, 30, 30, 30]
+
+
+def test_viewport_without_scroll_frames_jumps():
+    start = numbered(40)
+    end = start.replace("line 34\n", "line 34 changed\n")
+    seq = Sequence(start, end, "line", viewport_lines=10, scroll_frames=0)
+    assert tops(seq) == [0, 29, 29]
+
+
+def test_viewport_from_empty_start():
+    seq = Sequence("", numbered(20), "line", viewport_lines=5)
+    frames = list(seq)
+    assert frames[0].rows == 0
+    assert all(len(view.lines) <= 5 for view in frames)
+    assert frames[-1].top == 15
+    assert frames[-1].lines == [f"line {i}" for i in range(15, 20)]
+
+
+def test_viewport_cursor_at_eof():
+    start = numbered(20)
+    seq = Sequence(start, start + "line 20\n", "line", viewport_lines=5)
+    frames = list(seq)
+    # scroll to the last line of the current state, then follow the append
+    assert [view.top for view in frames] == [0, 3, 6, 9, 12, 15, 16, 16]
+    assert frames[-1].lines[-1] == "line 20"
+
+
+def test_viewport_height():
+    seq = Sequence(numbered(3), numbered(40), "line", viewport_lines=10)
+    assert seq.height(12) == 120
+    seq = Sequence(numbered(3), numbered(4), "line", viewport_lines=10)
+    assert seq.height(12) == 48